@@ -6,6 +6,9 @@ To add a new radio:
   1. Create a new .json file in the radios/ folder (copy any existing one as a template)
   2. Run: python3 build.py
 
+Parsed radio files are cached in .build_cache.json and only re-read when their
+modification time changes. Delete that file to force a full rebuild.
+
 Radio JSON fields:
   year           (int)    — e.g. 1940
   model          (str)    — e.g. "Philco Model 40-180"
@@ -16,68 +19,105 @@ Radio JSON fields:
   description_es (str)    — Spanish description
 """
 
+import functools
+import hashlib
 import json
-import re
+import os
+from html import escape
 from pathlib import Path
 
 RADIOS_DIR = Path(__file__).parent / "radios"
 INDEX_HTML = Path(__file__).parent / "index.html"
+CACHE_FILE = Path(__file__).parent / ".build_cache.json"
 
 GALLERY_START = "<!-- GALLERY:START -->"
 GALLERY_END   = "<!-- GALLERY:END -->"
 
+# Shape of a radio description entry in the translations: 'radioN.desc': '...'
+_DESC_KEY_PREFIX = "'radio"
+_DESC_KEY_SEP    = "': '"
+
+
+def load_cache():
+    """Return the contents of .build_cache.json, or an empty cache."""
+    try:
+        return json.loads(CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_atomic(path, data):
+    """Write bytes to a sibling temp file, then rename it over path."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+def save_cache(cache):
+    """Write the cache next to build.py, replacing the old one atomically."""
+    write_atomic(CACHE_FILE, json.dumps(cache).encode("utf-8"))
+
 
-def load_radios():
-    files = sorted(RADIOS_DIR.glob("*.json"))
+def _digest(value):
+    """Short blake2b hex digest of a JSON-serialisable value."""
+    data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def load_radios(cache=None):
+    """Load radios/*.json, re-parsing only files whose mtime changed since the
+    cached copy was stored in cache["radios"]."""
+    if cache is None:
+        cache = {}
+    with os.scandir(RADIOS_DIR) as it:
+        files = sorted(
+            (entry.name, entry.path, entry.stat().st_mtime_ns)
+            for entry in it
+            if entry.is_file() and entry.name.endswith(".json")
+        )
+    cached = cache.get("radios", {})
+    fresh = {}
     radios = []
-    for f in files:
-        with open(f) as fh:
-            data = json.load(fh)
-            data["_file"] = f.name
-            radios.append(data)
+    for name, path, mtime_ns in files:
+        hit = cached.get(name)
+        if hit is not None and hit[0] == mtime_ns:
+            data = dict(hit[1])
+        else:
+            data = json.loads(Path(path).read_bytes())
+        fresh[name] = [mtime_ns, dict(data)]
+        data["_file"] = name
+        radios.append(data)
+    cache["radios"] = fresh
     return radios
 
 
-def format_price(price):
-    return f"{price:,}€".replace(",", ".")
+def _prepare(radios):
+    """Precompute per-radio values shared by the gallery and translations,
+    including HTML-escaped copies of the fields interpolated into the cards."""
+    for i, radio in enumerate(radios):
+        radio["_idx_key"] = f"radio{i + 1}.desc"
+        radio["_price_fmt"] = format_price(radio.get("price", 0))
+        radio["_model_html"] = escape(radio["model"], quote=True)
+        radio["_desc_en_html"] = escape(radio["description_en"], quote=True)
+        radio["_image_html"] = escape(radio["image"], quote=True)
+    return radios
 
 
-def render_card(radio, index):
-    year          = radio["year"]
-    model         = radio["model"]
-    image         = radio["image"]
-    status        = radio.get("status", "sale")  # "sale", "sold", or "collection"
-    desc_en       = radio["description_en"]
-    desc_es       = radio["description_es"]
-    i18n_key_desc = f"radio{index}.desc"
+_THOUSANDS_SEP = str.maketrans(",", ".")
 
-    overlay = ""
-    position_relative = ''
 
-    if status == "sold":
-        position_relative = ' position: relative;'
-        overlay = """
-                        <div style="position: absolute; top: 0; right: 0; width: 250px; height: 250px; overflow: hidden; z-index: 10; pointer-events: none;">
-                            <div style="position: absolute; top: 55px; right: -70px; width: 350px; transform: rotate(45deg); background: linear-gradient(135deg, #8B0000 0%, #B22222 50%, #8B0000 100%); color: #f5ebe0; text-align: center; padding: 0.6rem 0; font-family: 'IBM Plex Mono', monospace; font-size: 0.75rem; font-weight: bold; text-transform: uppercase; letter-spacing: 0.25em; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.5); border-top: 1px solid rgba(212, 175, 55, 0.85); border-bottom: 1px solid rgba(212, 175, 55, 0.85);" data-i18n="gallery.sold">Sold</div>
-                        </div>"""
+@functools.lru_cache(maxsize=None)
+def format_price(price):
+    if 0 <= price < 1000:
+        return f"{price}€"
+    return format(price, ",").translate(_THOUSANDS_SEP) + "€"
 
-    if status == "sold":
-        price = radio.get("price", 0)
-        action_row = f"""
-                            <span style="font-family: 'Playfair Display', serif; font-size: 1.5rem; color: var(--tube-glow); font-weight: 700; text-decoration: line-through; opacity: 0.5;">{format_price(price)}</span>
-                            <span style="font-family: 'IBM Plex Mono', monospace; padding: 0.5rem 1rem; font-size: 0.75rem; opacity: 0.5;" data-i18n="gallery.sold">Sold</span>"""
-    elif status == "collection":
-        action_row = """
-                            <span style="font-family: 'IBM Plex Mono', monospace; font-size: 0.8rem; color: var(--copper); text-transform: uppercase; letter-spacing: 0.15em; opacity: 0.8;" data-i18n="gallery.collection">Personal Collection</span>
-                            <span></span>"""
-    else:  # sale
-        price = radio.get("price", 0)
-        action_row = f"""
-                            <span style="font-family: 'Playfair Display', serif; font-size: 1.5rem; color: var(--tube-glow); font-weight: 700;">{format_price(price)}</span>
-                            <a href="mailto:info@arstechnica.shop?subject=Inquiry: {model}" style="font-family: 'IBM Plex Mono', monospace; background: transparent; border: 2px solid var(--copper); color: var(--radio-warm); padding: 0.5rem 1rem; text-transform: uppercase; letter-spacing: 0.15em; font-size: 0.75rem; text-decoration: none; transition: all 0.3s;" data-i18n="gallery.inquire">Inquire</a>"""
 
-    return f"""
-                    <div class="service-card" data-status="{status}" style="padding: 0; overflow: hidden; display: flex; flex-direction: column;{position_relative}">{overlay}
+_CARD_OPEN = """
+                    <div class="service-card" data-status="{status}" style="padding: 0; overflow: hidden; display: flex; flex-direction: column;{position_relative}">"""
+
+_CARD_BODY = """
                         <div style="width: 100%; aspect-ratio: 4/3; overflow: hidden; flex-shrink: 0;">
                             <img src="{image}" alt="{year} {model}" style="width: 100%; height: 100%; object-fit: cover;">
                         </div>
@@ -85,14 +125,69 @@ def render_card(radio, index):
                             <div style="font-family: 'IBM Plex Mono', monospace; font-size: 0.85rem; color: var(--copper); text-transform: uppercase; letter-spacing: 0.2em; margin-bottom: 0.5rem;">{year}</div>
                             <h4 style="margin-bottom: 0.8rem;">{model}</h4>
                             <p style="margin-bottom: 0; font-size: 0.95rem; flex: 1;" data-i18n="{i18n_key_desc}">{desc_en}</p>
-                            <div style="display: flex; justify-content: space-between; align-items: center; padding-top: 1rem; margin-top: 1rem; border-top: 1px solid rgba(184, 115, 51, 0.3);">{action_row}
+                            <div style="display: flex; justify-content: space-between; align-items: center; padding-top: 1rem; margin-top: 1rem; border-top: 1px solid rgba(184, 115, 51, 0.3);">"""
+
+_CARD_CLOSE = """
                             </div>
                         </div>
                     </div>"""
 
+_ACTION_SOLD = """
+                            <span style="font-family: 'Playfair Display', serif; font-size: 1.5rem; color: var(--tube-glow); font-weight: 700; text-decoration: line-through; opacity: 0.5;">{price}</span>
+                            <span style="font-family: 'IBM Plex Mono', monospace; padding: 0.5rem 1rem; font-size: 0.75rem; opacity: 0.5;" data-i18n="gallery.sold">Sold</span>"""
+
+_ACTION_COLLECTION = """
+                            <span style="font-family: 'IBM Plex Mono', monospace; font-size: 0.8rem; color: var(--copper); text-transform: uppercase; letter-spacing: 0.15em; opacity: 0.8;" data-i18n="gallery.collection">Personal Collection</span>
+                            <span></span>"""
+
+_ACTION_SALE = """
+                            <span style="font-family: 'Playfair Display', serif; font-size: 1.5rem; color: var(--tube-glow); font-weight: 700;">{price}</span>
+                            <a href="mailto:info@arstechnica.shop?subject=Inquiry: {model}" style="font-family: 'IBM Plex Mono', monospace; background: transparent; border: 2px solid var(--copper); color: var(--radio-warm); padding: 0.5rem 1rem; text-transform: uppercase; letter-spacing: 0.15em; font-size: 0.75rem; text-decoration: none; transition: all 0.3s;" data-i18n="gallery.inquire">Inquire</a>"""
+
+_SOLD_POSITION = ' position: relative;'
+
+_SOLD_OVERLAY_HTML = """
+                        <div style="position: absolute; top: 0; right: 0; width: 250px; height: 250px; overflow: hidden; z-index: 10; pointer-events: none;">
+                            <div style="position: absolute; top: 55px; right: -70px; width: 350px; transform: rotate(45deg); background: linear-gradient(135deg, #8B0000 0%, #B22222 50%, #8B0000 100%); color: #f5ebe0; text-align: center; padding: 0.6rem 0; font-family: 'IBM Plex Mono', monospace; font-size: 0.75rem; font-weight: bold; text-transform: uppercase; letter-spacing: 0.25em; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.5); border-top: 1px solid rgba(212, 175, 55, 0.85); border-bottom: 1px solid rgba(212, 175, 55, 0.85);" data-i18n="gallery.sold">Sold</div>
+                        </div>"""
+
+
+def render_card(radio):
+    status = radio.get("status", "sale")  # "sale", "sold", or "collection"
+    fields = {
+        "year":          radio["year"],
+        "model":         radio["_model_html"],
+        "image":         radio["_image_html"],
+        "status":        status,
+        "desc_en":       radio["_desc_en_html"],
+        "i18n_key_desc": radio["_idx_key"],
+        "price":         radio["_price_fmt"],
+    }
+
+    overlay = ""
+    fields["position_relative"] = ""
+
+    if status == "sold":
+        overlay = _SOLD_OVERLAY_HTML
+        fields["position_relative"] = _SOLD_POSITION
+        action_row = _ACTION_SOLD.format_map(fields)
+    elif status == "collection":
+        action_row = _ACTION_COLLECTION
+    else:  # sale
+        action_row = _ACTION_SALE.format_map(fields)
+
+    parts = [
+        _CARD_OPEN.format_map(fields),
+        overlay,
+        _CARD_BODY.format_map(fields),
+        action_row,
+        _CARD_CLOSE,
+    ]
+    return "".join(parts)
+
 
 def render_gallery(radios):
-    cards = "".join(render_card(r, i + 1) for i, r in enumerate(radios))
+    cards = "".join(render_card(r) for r in radios)
     return f"""{GALLERY_START}
                 {cards}
                 {GALLERY_END}"""
@@ -101,80 +196,148 @@ def render_gallery(radios):
 def build_translations(radios):
     en_entries = {}
     es_entries = {}
-    for i, radio in enumerate(radios):
-        key = f"radio{i + 1}.desc"
+    for radio in radios:
+        key = radio["_idx_key"]
         en_entries[key] = radio["description_en"]
         es_entries[key] = radio["description_es"]
     return en_entries, es_entries
 
 
-def update_translations(html, en_entries, es_entries):
-    """Replace radio*.desc keys inside each language block independently."""
-
-    def find_lang_block(html, lang_key):
-        """Return (start, end) character offsets of the content inside lang: { ... }."""
-        marker = f"{lang_key}: {{"
-        start = html.find(marker)
-        if start == -1:
-            return None, None
-        brace_start = html.index("{", start + len(lang_key))
-        depth = 0
-        for i in range(brace_start, len(html)):
-            if html[i] == "{":
-                depth += 1
-            elif html[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    return brace_start, i + 1
-        return None, None
+def splice_regions(html, edits):
+    """Apply non-overlapping (start, end, text) replacements to html.
+
+    Offsets refer to the original string, so the result is assembled with a
+    single join instead of re-slicing html once per edit.
+    """
+    parts = []
+    pos = 0
+    for start, end, text in sorted(edits):
+        parts.append(html[pos:start])
+        parts.append(text)
+        pos = end
+    parts.append(html[pos:])
+    return "".join(parts)
+
+
+def translation_edits(html, en_entries, es_entries):
+    """Return (start, end, text) edits replacing radio*.desc keys inside each
+    language block of html."""
+
+    def find_lang_blocks(html, lang_keys):
+        """Return {lang: (start, end)} offsets of the content inside each
+        lang: { ... } block, found in a single left-to-right walk."""
+        blocks = {}
+        pending = list(lang_keys)
+        pos = 0
+        while pending:
+            colon = html.find(": {", pos)
+            if colon == -1:
+                break
+            lang_key = next((k for k in pending if html.endswith(k, 0, colon)), None)
+            if lang_key is None:
+                pos = colon + 1
+                continue
+            brace_start = colon + 2
+            depth = 0
+            for i in range(brace_start, len(html)):
+                if html[i] == "{":
+                    depth += 1
+                elif html[i] == "}":
+                    depth -= 1
+                    if depth == 0:
+                        blocks[lang_key] = (brace_start, i + 1)
+                        break
+            else:
+                break
+            pending.remove(lang_key)
+            pos = i + 1
+        return blocks
 
     def replace_keys_in_slice(block, entries):
-        for key, value in entries.items():
-            escaped = value.replace("'", "\\'")
-            pattern = rf"('{re.escape(key)}'\s*:\s*')[^']*(')"
-            block = re.sub(pattern, rf"\g<1>{escaped}\g<2>", block)
-        return block
-
+        """Rewrite every radio*.desc value in a single left-to-right pass."""
+        parts = []
+        pos = 0
+        i = block.find(_DESC_KEY_PREFIX)
+        while i != -1:
+            key_end = block.find("'", i + 1)
+            if key_end == -1:
+                break
+            key = block[i + 1:key_end]
+            if key in entries and block.startswith(_DESC_KEY_SEP, key_end):
+                value_start = key_end + len(_DESC_KEY_SEP)
+                value_end = block.index("'", value_start)
+                parts.append(block[pos:value_start])
+                parts.append(entries[key].replace("'", "\\'"))
+                pos = key_end = value_end
+            i = block.find(_DESC_KEY_PREFIX, key_end + 1)
+        parts.append(block[pos:])
+        return "".join(parts)
+
+    blocks = find_lang_blocks(html, ["en", "es"])
+    edits = []
     for lang_key, entries in [("en", en_entries), ("es", es_entries)]:
-        start, end = find_lang_block(html, lang_key)
-        if start is None:
+        if lang_key not in blocks:
             continue
-        block = html[start:end]
-        block = replace_keys_in_slice(block, entries)
-        html = html[:start] + block + html[end:]
+        start, end = blocks[lang_key]
+        block = replace_keys_in_slice(html[start:end], entries)
+        edits.append((start, end, block))
+    return edits
 
-    return html
+
+def update_translations(html, en_entries, es_entries):
+    """Replace radio*.desc keys inside each language block independently."""
+    return splice_regions(html, translation_edits(html, en_entries, es_entries))
 
 
 def main():
-    radios = load_radios()
+    cache = load_cache()
+    radios = _prepare(load_radios(cache))
     if not radios:
         print("No radio JSON files found in radios/")
         return
 
-    html = INDEX_HTML.read_text()
+    html = INDEX_HTML.read_bytes().decode("utf-8")
 
-    # Replace gallery section
+    # Locate gallery section
     start_idx = html.find(GALLERY_START)
-    end_idx   = html.find(GALLERY_END)
+    end_idx   = html.find(GALLERY_END, start_idx)
 
     if start_idx == -1 or end_idx == -1:
         print(f"Error: Could not find {GALLERY_START!r} / {GALLERY_END!r} markers in index.html")
         print("Please add these markers around the gallery cards in index.html first.")
         return
 
+    # Skip work whose inputs match the last build, as long as index.html is
+    # still exactly what that build wrote
+    index_unchanged = cache.get("index") == _digest(html)
     new_gallery = render_gallery(radios)
-    html = html[:start_idx] + new_gallery + html[end_idx + len(GALLERY_END):]
-
-    # Update translations
+    gallery_hash = _digest(new_gallery)
     en_entries, es_entries = build_translations(radios)
-    html = update_translations(html, en_entries, es_entries)
+    translations_hash = _digest(sorted(
+        (key, en_entries[key], es_entries[key]) for key in en_entries
+    ))
+    translations_unchanged = index_unchanged and cache.get("translations") == translations_hash
+
+    if translations_unchanged and cache.get("gallery") == gallery_hash:
+        save_cache(cache)
+        print(f"index.html is up to date ({len(radios)} radio(s))")
+        return
 
-    INDEX_HTML.write_text(html)
+    # Collect gallery and translation replacements, then splice them in once
+    edits = [(start_idx, end_idx + len(GALLERY_END), new_gallery)]
+    if not translations_unchanged:
+        edits.extend(translation_edits(html, en_entries, es_entries))
+    html = splice_regions(html, edits)
+
+    write_atomic(INDEX_HTML, html.encode("utf-8"))
+    cache["index"] = _digest(html)
+    cache["gallery"] = gallery_hash
+    cache["translations"] = translations_hash
+    save_cache(cache)
     print(f"Built gallery with {len(radios)} radio(s):")
     for r in radios:
         st = r.get("status", "sale")
-        label = {"sold": "SOLD", "collection": "COLLECTION"}.get(st, format_price(r.get("price", 0)))
+        label = {"sold": "SOLD", "collection": "COLLECTION"}.get(st, r["_price_fmt"])
         print(f"  {r['year']} {r['model']} — {label}")
 
 